@@ -4,10 +4,13 @@
 # خادم Flask لتقديم الـ HTML (Frontend) ونقاط نهاية الـ API (Backend)
 # -----------------------------------------------------
 
-from flask import Flask, request, jsonify, render_template # استيراد render_template
+from flask import Flask, Response, request, jsonify, render_template # استيراد render_template
 from flask_cors import CORS
+import orjson
+from functools import lru_cache
 import os
 import random
+import threading
 import time 
 
 # -----------------------------------------------------
@@ -17,6 +20,9 @@ import time
 APP_ID = 'soil_agent_app'
 BASE_IMAGE_DIR = '' 
 IMG_SIZE = (224, 224)
+MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # الحد الأقصى لحجم جسم الطلب (10 ميغابايت)
+PREV_CROPS_CACHE_MAX_LEN = 256  # أطول نص محاصيل سابقة يُخزَّن تحليله في الكاش
+REPORT_CACHE_MAX_LOCATION_LEN = 256  # أطول اسم موقع يُخزَّن تقريره في الكاش
 CLASS_NAMES = ['Alluvial_Soil','Black_Soil','Laterite_Soil','Red_Soil','Yellow_Soil']
 
 CROP_PROPERTIES = {
@@ -35,6 +41,7 @@ BASE_COSTS_PER_HA = {
     'seed_dzd': 50000, 'water_dzd': 70000, 'fertilizer_dzd': 40000, 
     'pesticide_dzd': 20000, 'labor_dzd': 120000
 }
+BASE_COST_PER_HA_TOTAL = sum(BASE_COSTS_PER_HA.values())
 
 PRICE_PER_KG_DZD = {
     'تمر': 450, 'عنب': 200, 'طماطم': 80, 'بطاطا': 60, 
@@ -46,6 +53,20 @@ WATER_NEED_M3_HA = {
     'قمح_صلب': 4500, 'شعير': 4000, 'زيتون': 3000, 'بقوليات': 5500, 'بطيخ': 7000
 }
 
+SOIL_BONUS = {
+    'Alluvial_Soil': { 'تمر': 1.2, 'قمح_صلب': 1.1, 'طماطم': 1.05 },
+    'Black_Soil': { 'قمح_صلب': 1.15, 'بطاطا': 1.1, 'بطيخ': 1.0 },
+    'Laterite_Soil': { 'زيتون': 1.2, 'عنب': 1.1, 'تمر': 1.0 },
+    'Red_Soil': { 'بطاطا': 1.05, 'طماطم': 1.1, 'قمح_صلب': 1.0 },
+    'Yellow_Soil': { 'بقوليات': 1.15, 'شعير': 1.1, 'عنب': 1.0 }
+}
+
+SOIL_TYPE_AR = {
+    'Alluvial_Soil': 'تربة طينية/رسوبية', 'Black_Soil': 'تربة سوداء',
+    'Laterite_Soil': 'تربة لاتيريتية', 'Red_Soil': 'تربة حمراء',
+    'Yellow_Soil': 'تربة صفراء'
+}
+
 PREF_OPTIONS_MAP = {
     "زيادة الأرباح المالية": "high_profit",
     "استهلاك ماء منخفض": "low_water",
@@ -53,18 +74,82 @@ PREF_OPTIONS_MAP = {
     "لا شيء (معايير عامة)": "none"
 }
 
+# أعمدة متوازية (بنفس ترتيب CROP_NAMES) تُحسب مرة واحدة عند تحميل الوحدة بدل إعادة حسابها مع كل طلب
+CROP_NAMES = tuple(CROP_PROPERTIES)
+CROP_NAMES_LOWER = tuple(crop.lower() for crop in CROP_NAMES)
+CROP_WATER_NEEDS = tuple(prop[0] for prop in CROP_PROPERTIES.values())
+CROP_COSTS = tuple(prop[1] for prop in CROP_PROPERTIES.values())
+CROP_PROFITS = tuple(prop[2] for prop in CROP_PROPERTIES.values())
+CROP_BASE_SCORES = tuple(
+    (profit * 0.4) + ((1 - water) * 0.3) + ((1 - cost) * 0.3)
+    for water, cost, profit in zip(CROP_WATER_NEEDS, CROP_COSTS, CROP_PROFITS)
+)
+
+# مصفوفة كثيفة لمعاملات التربة: صف لكل نوع تربة (بترتيب CLASS_NAMES) وعمود لكل محصول
+SOIL_INDEX = {name: i for i, name in enumerate(CLASS_NAMES)}
+CROP_INDEX = {name: i for i, name in enumerate(CROP_NAMES)}
+SOIL_BONUS_MATRIX = tuple(
+    tuple(SOIL_BONUS.get(soil, {}).get(crop, 1.0) for crop in CROP_NAMES)
+    for soil in CLASS_NAMES
+)
+
+# معاملات تفضيل المزارع الثابتة لكل محصول؛ باقي التفضيلات لا تغيّر الدرجة على مستوى المحصول
+NEUTRAL_MULTIPLIERS = (1.0,) * len(CROP_NAMES)
+PREF_MULTIPLIERS = {
+    'high_profit': tuple(1 + profit * 0.3 for profit in CROP_PROFITS),
+    'low_water': tuple(1 + (1 - water) * 0.3 for water in CROP_WATER_NEEDS),
+}
+
+REPORT_TEMPLATE = """
+=====================================================
+** تقرير الخطة الزراعية والمالية التفصيلي للموسم**
+=====================================================
+الموقع: {location_name}
+تاريخ التقرير: {report_date}
+نوع التربة المُحدد: {soil_type_ar}
+
+I. التوصية الرئيسية والملاءمة
+المحصول المقترح: {selected_crop}
+مستوى الملاءمة: {current_score:.1f}%
+
+II. الخطة المالية المتوقعة (لـ {area_ha:.2f} هكتار)
+| البند | التقدير (د.ج) |
+| :--- | :--- |
+| الإيرادات الكلية | {total_revenue:,.0f} |
+| إجمالي التكاليف | {total_cost:,.0f} |
+| الربح الصافي المتوقع | **{net_profit:,.0f}** |
+
+III. المؤشرات الزراعية
+| المؤشر | القيمة | الوحدة |
+| :--- | :--- | :--- |
+| المساحة الكلية | {area_sqm:,.0f} | م² |
+| المردود المتوقع | {expected_yield:,.0f} | كغم |
+| الاحتياج المائي الكلي | {water_need_m3:,.0f} | م³ |
+=====================================================
+""".strip()
+
 GLOBAL_HISTORICAL_ANALYSIS = None
+_HIST_LOCK = threading.Lock()  # يحمي GLOBAL_HISTORICAL_ANALYSIS عند التشغيل بعدة خيوط (gthread)
 
 # -----------------------------------------------------
 # دوال المحاكاة (لم يتم تغيير هذا الجزء)
 # -----------------------------------------------------
 
-def predict_soil_type(image_path):
-    """محاكاة تحليل صورة التربة بدون نموذج ML حقيقي."""
-    if not image_path:
-        return random.choice(CLASS_NAMES)
+_rng_local = threading.local()
+
+def _thread_rng():
+    """مولد أرقام عشوائية خاص بكل خيط لتفادي التنافس على المولد العام للوحدة random."""
+    rng = getattr(_rng_local, 'rng', None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random()
+    return rng
 
-    name_lower = image_path.lower()
+def predict_soil_type(filename):
+    """محاكاة تحليل صورة التربة بدون نموذج ML حقيقي (يعتمد على اسم الملف فقط دون قراءة محتواه)."""
+    if not filename:
+        return _thread_rng().choice(CLASS_NAMES)
+
+    name_lower = filename.lower()
     if "red" in name_lower:
         return "Red_Soil"
     elif "black" in name_lower:
@@ -76,54 +161,86 @@ def predict_soil_type(image_path):
     elif "laterite" in name_lower:
         return "Laterite_Soil"
 
-    return random.choice(CLASS_NAMES)
+    return _thread_rng().choice(CLASS_NAMES)
+
+def _split_prev_crops(prev_crops_str):
+    """تحليل قائمة المحاصيل السابقة (مفصولة بفواصل) إلى مجموعة أسماء بأحرف صغيرة."""
+    return frozenset(c.strip().lower() for c in prev_crops_str.split(',') if c.strip())
+
+_split_prev_crops_cached = lru_cache(maxsize=1024)(_split_prev_crops)
+
+def _parse_prev_crops(prev_crops_str):
+    """تخزين نتيجة التحليل للطلبات المتكررة، مع استثناء المدخلات الطويلة حتى لا يحتفظ الكاش بحمولات ضخمة من العميل."""
+    if len(prev_crops_str) > PREV_CROPS_CACHE_MAX_LEN:
+        return _split_prev_crops(prev_crops_str)
+    return _split_prev_crops_cached(prev_crops_str)
+
+def _efficiency_multiplier(farmer_pref, historical_analysis):
+    """معامل كفاءة الماء المستخرج من التحليل التاريخي (يطبق على كل المحاصيل)."""
+    if farmer_pref == 'improve_efficiency' and historical_analysis and 'water_efficiency_ratio' in historical_analysis:
+        return 1 + historical_analysis.get('water_efficiency_ratio', 0) * 0.05
+    return 1.0
+
+def _finalize_score(base_score, crop_lower, prev_crops, desired_lower):
+    """تطبيق عقوبة الدورة الزراعية ومكافأة المحصول المرغوب ثم تحويل الدرجة إلى نسبة مئوية."""
+    if crop_lower in prev_crops:
+        base_score *= 0.8
+
+    if crop_lower == desired_lower:
+        base_score *= 1.3
+
+    final_score = min(100, max(0, base_score * 80 + 10))
+    return round(final_score, 1)
 
 def determine_suitability(soil_type, area_sqm, prev_crops_str, farmer_pref, desired_crop, historical_analysis=None):
     area_ha = area_sqm / 10000
-    prev_crops = [c.strip().lower() for c in prev_crops_str.split(',') if c.strip()]
+    prev_crops = _parse_prev_crops(prev_crops_str)
+    desired_lower = desired_crop.strip().lower() if desired_crop else None
     suitability_scores = []
 
-    SOIL_BONUS = {
-        'Alluvial_Soil': { 'تمر': 1.2, 'قمح_صلب': 1.1, 'طماطم': 1.05 },
-        'Black_Soil': { 'قمح_صلب': 1.15, 'بطاطا': 1.1, 'بطيخ': 1.0 },
-        'Laterite_Soil': { 'زيتون': 1.2, 'عنب': 1.1, 'تمر': 1.0 },
-        'Red_Soil': { 'بطاطا': 1.05, 'طماطم': 1.1, 'قمح_صلب': 1.0 },
-        'Yellow_Soil': { 'بقوليات': 1.15, 'شعير': 1.1, 'عنب': 1.0 }
-    }
+    soil_index = SOIL_INDEX.get(soil_type)
+    soil_bonuses = SOIL_BONUS_MATRIX[soil_index] if soil_index is not None else NEUTRAL_MULTIPLIERS
+    pref_multipliers = PREF_MULTIPLIERS.get(farmer_pref, NEUTRAL_MULTIPLIERS)
+    efficiency_multiplier = _efficiency_multiplier(farmer_pref, historical_analysis)
+
+    for crop, crop_lower, base_score, soil_bonus, pref_multiplier in zip(
+        CROP_NAMES, CROP_NAMES_LOWER, CROP_BASE_SCORES, soil_bonuses, pref_multipliers
+    ):
+        base_score *= soil_bonus
+        base_score *= pref_multiplier
+        base_score *= efficiency_multiplier
+
+        score = _finalize_score(base_score, crop_lower, prev_crops, desired_lower)
+        suitability_scores.append({'crop': crop, 'score': score})
 
-    for crop, prop in CROP_PROPERTIES.items():
-        water_need, cost_ratio, profit_ratio, _ = prop
-        base_score = (profit_ratio * 0.4) + ((1 - water_need) * 0.3) + ((1 - cost_ratio) * 0.3)
-        base_score *= SOIL_BONUS.get(soil_type, {}).get(crop, 1.0)
+    suitability_scores.sort(key=lambda x: x['score'], reverse=True)
+    return suitability_scores
 
-        if farmer_pref == 'high_profit':
-            base_score *= (1 + profit_ratio * 0.3)
-        elif farmer_pref == 'low_water':
-            base_score *= (1 + (1 - water_need) * 0.3)
-        elif farmer_pref == 'improve_efficiency' and historical_analysis and 'water_efficiency_ratio' in historical_analysis:
-            base_score *= (1 + historical_analysis.get('water_efficiency_ratio', 0) * 0.05) 
+def determine_single_crop_suitability(soil_type, area_sqm, prev_crops_str, farmer_pref, crop, historical_analysis=None, desired_crop=None):
+    """حساب درجة ملاءمة محصول واحد فقط، مطابقة لقيمته في نتيجة determine_suitability دون حساب وترتيب باقي المحاصيل."""
+    crop_index = CROP_INDEX.get(crop)
+    if crop_index is None:
+        return 0.0
 
-        if crop.lower() in prev_crops:
-            base_score *= 0.8
+    prev_crops = _parse_prev_crops(prev_crops_str)
+    desired_lower = desired_crop.strip().lower() if desired_crop else None
 
-        if desired_crop and crop.lower().strip() == desired_crop.lower().strip():
-            base_score *= 1.3
+    soil_index = SOIL_INDEX.get(soil_type)
+    base_score = CROP_BASE_SCORES[crop_index]
+    base_score *= SOIL_BONUS_MATRIX[soil_index][crop_index] if soil_index is not None else 1.0
+    base_score *= PREF_MULTIPLIERS.get(farmer_pref, NEUTRAL_MULTIPLIERS)[crop_index]
+    base_score *= _efficiency_multiplier(farmer_pref, historical_analysis)
 
-        final_score = min(100, max(0, base_score * 80 + 10))
-        suitability_scores.append({'crop': crop, 'score': round(final_score,1)})
+    return _finalize_score(base_score, CROP_NAMES_LOWER[crop_index], prev_crops, desired_lower)
 
-    suitability_scores.sort(key=lambda x: x['score'], reverse=True)
-    return suitability_scores
+REPORT_DATE_PLACEHOLDER = '{report_date}'
 
-def generate_detailed_report(selected_crop, area_sqm, soil_type, location_name, recommendations, historical_analysis):
+def _render_report(selected_crop, area_sqm, soil_type_ar, location_name, current_score):
+    """توليد نص التقرير لمجموعة مدخلات معينة مع ترك خانة التاريخ فارغة."""
     area_ha = area_sqm / 10000
-    details = CROP_PROPERTIES.get(selected_crop)
-    current_score = next((r['score'] for r in recommendations if r['crop'] == selected_crop), 0.0)
+    details = CROP_PROPERTIES[selected_crop]
 
-    if not details:
-        return "خطأ: لا توجد بيانات تفصيلية (CROP_PROPERTIES) للمحصول المحدد. يرجى اختيار محصول من القائمة المقترحة."
-
-    base_cost_per_ha = sum(BASE_COSTS_PER_HA.values())
+    base_cost_per_ha = BASE_COST_PER_HA_TOTAL
     total_cost = base_cost_per_ha * area_ha
     expected_yield_kg_ha = details[3]
     expected_yield = expected_yield_kg_ha * area_ha
@@ -132,51 +249,57 @@ def generate_detailed_report(selected_crop, area_sqm, soil_type, location_name,
     net_profit = total_revenue - total_cost
     water_need_m3 = WATER_NEED_M3_HA.get(selected_crop, 5000) * area_ha
 
-    soil_type_ar = {
-        'Alluvial_Soil': 'تربة طينية/رسوبية', 'Black_Soil': 'تربة سوداء',
-        'Laterite_Soil': 'تربة لاتيريتية', 'Red_Soil': 'تربة حمراء',
-        'Yellow_Soil': 'تربة صفراء'
-    }.get(soil_type, 'غير محدد')
-    
-    report_date = time.strftime("%Y-%m-%d %H:%M:%S")
+    return REPORT_TEMPLATE.format(
+        location_name=location_name, report_date=REPORT_DATE_PLACEHOLDER, soil_type_ar=soil_type_ar,
+        selected_crop=selected_crop, current_score=current_score, area_ha=area_ha,
+        total_revenue=total_revenue, total_cost=total_cost, net_profit=net_profit,
+        area_sqm=area_sqm, expected_yield=expected_yield, water_need_m3=water_need_m3
+    )
 
-    report = f"""
-=====================================================
-** تقرير الخطة الزراعية والمالية التفصيلي للموسم**
-=====================================================
-الموقع: {location_name}
-تاريخ التقرير: {report_date}
-نوع التربة المُحدد: {soil_type_ar}
+# نسخة مخزنة للطلبات المتكررة بنفس المدخلات
+_render_report_cached = lru_cache(maxsize=512)(_render_report)
 
-I. التوصية الرئيسية والملاءمة
-المحصول المقترح: {selected_crop}
-مستوى الملاءمة: {current_score:.1f}%
+def generate_detailed_report(selected_crop, area_sqm, soil_type, location_name, recommendations, historical_analysis):
+    details = CROP_PROPERTIES.get(selected_crop)
+    current_score = {r['crop']: r['score'] for r in recommendations}.get(selected_crop, 0.0)
 
-II. الخطة المالية المتوقعة (لـ {area_ha:.2f} هكتار)
-| البند | التقدير (د.ج) |
-| :--- | :--- |
-| الإيرادات الكلية | {total_revenue:,.0f} |
-| إجمالي التكاليف | {total_cost:,.0f} |
-| الربح الصافي المتوقع | **{net_profit:,.0f}** |
+    if not details:
+        return "خطأ: لا توجد بيانات تفصيلية (CROP_PROPERTIES) للمحصول المحدد. يرجى اختيار محصول من القائمة المقترحة."
 
-III. المؤشرات الزراعية
-| المؤشر | القيمة | الوحدة |
-| :--- | :--- | :--- |
-| المساحة الكلية | {area_sqm:,.0f} | م² |
-| المردود المتوقع | {expected_yield:,.0f} | كغم |
-| الاحتياج المائي الكلي | {water_need_m3:,.0f} | م³ |
-=====================================================
-"""
-    return report.strip()
+    # التربة تُحوّل إلى اسمها العربي قبل التخزين حتى يبقى المفتاح من مجموعة محدودة؛
+    # و str(location_name) يبقي المفتاح قابلاً للتجزئة ويعطي نفس النص في التقرير
+    soil_type_ar = SOIL_TYPE_AR.get(soil_type, 'غير محدد')
+    location_name = str(location_name)
+
+    # الموقع نص حر من العميل؛ القيم الطويلة لا تُخزَّن حتى لا يحتفظ الكاش بحمولات ضخمة
+    if len(location_name) > REPORT_CACHE_MAX_LOCATION_LEN:
+        report = _render_report(selected_crop, area_sqm, soil_type_ar, location_name, current_score)
+    else:
+        report = _render_report_cached(selected_crop, area_sqm, soil_type_ar, location_name, current_score)
+
+    # التاريخ يتغير مع كل طلب فيُحقن بعد التخزين؛ آخر ظهور للخانة هو خانة التاريخ لأن الموقع يسبقها
+    head, _, tail = report.rpartition(REPORT_DATE_PLACEHOLDER)
+    report_date = time.strftime("%Y-%m-%d %H:%M:%S")
+    return head + report_date + tail
 
 # -----------------------------------------------------
 # خادم Flask
 # -----------------------------------------------------
 
+def fast_jsonify(obj):
+    """ترميز ردود JSON عبر orjson للحمولات التي يبنيها الخادم فقط (التوصيات والتقرير)؛ باقي الردود تبقى عبر jsonify."""
+    return Response(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS), mimetype='application/json')
+
 # تهيئة Flask مع تحديد مسار مجلد الـ templates
 app = Flask(__name__, template_folder='templates') 
+app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 CORS(app) 
 
+@app.errorhandler(413)
+def request_too_large(e):
+    """رفض الطلبات التي تتجاوز MAX_CONTENT_LENGTH قبل قراءة جسمها."""
+    return jsonify({'error': "حجم الطلب يتجاوز الحد المسموح به."}), 413
+
 # ↓↓↓↓↓↓↓↓↓↓↓↓↓ تم إضافة هذا لتقديم الـ HTML ↓↓↓↓↓↓↓↓↓↓↓↓↓
 @app.route('/', methods=['GET'])
 def home():
@@ -189,18 +312,23 @@ def home():
 def api_analyze_soil():
     data = request.json
     try:
-        image_path = data.get('image_path')
+        filename = data.get('image_path')
+        if filename and not isinstance(filename, str):
+            return jsonify({'error': "اسم ملف الصورة غير صالح."}), 400
         area_sqm = float(data.get('area_sqm', 10000)) 
         prev_crops_str = data.get('prev_crops_str', '')
         farmer_pref = data.get('farmer_pref', 'none')
         desired_crop = data.get('desired_crop', '')
 
-        soil_type = predict_soil_type(image_path)
+        with _HIST_LOCK:
+            historical_analysis = GLOBAL_HISTORICAL_ANALYSIS
+
+        soil_type = predict_soil_type(filename)
         recommendations = determine_suitability(
-            soil_type, area_sqm, prev_crops_str, farmer_pref, desired_crop, GLOBAL_HISTORICAL_ANALYSIS
+            soil_type, area_sqm, prev_crops_str, farmer_pref, desired_crop, historical_analysis
         )
 
-        return jsonify({'soil_type': soil_type, 'recommendations': recommendations})
+        return fast_jsonify({'soil_type': soil_type, 'recommendations': recommendations})
     except Exception as e:
         return jsonify({'error': f"خطأ في تحليل التربة: {str(e)}"}), 500
 
@@ -215,13 +343,27 @@ def api_generate_plan():
         area_sqm = float(data.get('area_sqm', 10000))
         soil_type = data.get('soil_type')
         location_name = data.get('location_name')
-        recommendations = data.get('recommendations', [])
+
+        with _HIST_LOCK:
+            historical_analysis = GLOBAL_HISTORICAL_ANALYSIS
+
+        # إذا لم يرسل العميل التوصيات، تُحسب درجة المحصول المختار وحده بدل تقييم كل المحاصيل.
+        # ملاحظة: الواجهة (index_final.html) لا ترسل prev_crops_str و farmer_pref و desired_crop لهذه النقطة،
+        # لذلك تتجاهل هذه الدرجة عقوبة الدورة الزراعية وتفضيل المزارع ومكافأة المحصول المرغوب
+        # وقد تختلف عن الدرجة التي أعادتها /api/analyze_soil.
+        recommendations = data.get('recommendations') or [{
+            'crop': selected_crop,
+            'score': determine_single_crop_suitability(
+                soil_type, area_sqm, data.get('prev_crops_str') or '', data.get('farmer_pref') or 'none',
+                selected_crop, historical_analysis, data.get('desired_crop') or ''
+            )
+        }]
 
         report_text = generate_detailed_report(
-            selected_crop, area_sqm, soil_type, location_name, recommendations, GLOBAL_HISTORICAL_ANALYSIS
+            selected_crop, area_sqm, soil_type, location_name, recommendations, historical_analysis
         )
 
-        return jsonify({'report': report_text})
+        return fast_jsonify({'report': report_text})
     except Exception as e:
         return jsonify({'error': f"خطأ في توليد الخطة: {str(e)}"}), 500
 
@@ -240,19 +382,25 @@ def api_analyze_historical():
         area_ha = area_sqm / 10000
         water_efficiency_ratio = (actual_yield / area_ha) / actual_water
         
-        GLOBAL_HISTORICAL_ANALYSIS = {
+        analysis = {
             'previous_crop': data.get('crop'),
             'water_efficiency_ratio': water_efficiency_ratio,
             'message': f"تم تحليل الأداء التاريخي لـ {data.get('crop')} بنجاح. كفاءة الماء: {water_efficiency_ratio:.2f} كغم/م³."
         }
+        with _HIST_LOCK:
+            GLOBAL_HISTORICAL_ANALYSIS = analysis
         
-        return jsonify({'message': GLOBAL_HISTORICAL_ANALYSIS['message'], 'analysis': GLOBAL_HISTORICAL_ANALYSIS})
+        return jsonify({'message': analysis['message'], 'analysis': analysis})
 
     except Exception as e:
         return jsonify({'error': f"خطأ في معالجة البيانات التاريخية: {str(e)}"}), 500
 
 if __name__ == '__main__':
-    # لتشغيل Render، قد تحتاج إلى إضافة 'host='0.0.0.0'
-    app.run(debug=True)
+    # خادم التطوير فقط؛ في الإنتاج (Render) يتم التشغيل عبر gunicorn كما في Procfile
+    app.run(
+        host=os.environ.get('HOST', '127.0.0.1'),
+        port=int(os.environ.get('PORT', 5000)),
+        debug=os.environ.get('FLASK_ENV') == 'development'
+    )
 
 